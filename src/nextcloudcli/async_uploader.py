@@ -0,0 +1,184 @@
+"""Asynchronous Nextcloud upload functionality built on aiohttp.
+
+This module requires the optional ``async`` extra::
+
+    pip install nextcloudcli[async]
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Optional, Union
+
+from nextcloudcli.uploader import _DEFAULT_READ_SIZE, NextcloudUploader
+
+try:
+    import aiofiles
+    import aiohttp
+except ImportError:  # pragma: no cover - exercised only without the extra
+    aiofiles = None  # type: ignore[assignment]
+    aiohttp = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+
+async def _aiter_chunks(
+    f: Any, chunk_size: int = _DEFAULT_READ_SIZE
+) -> AsyncIterator[bytes]:
+    """Yield chunks from an async file object until EOF.
+
+    Args:
+        f: An async file object with an awaitable read() method
+        chunk_size: Size of chunks to read (default 1 MiB)
+
+    Yields:
+        Chunks of file data
+    """
+    while True:
+        chunk = await f.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+class AsyncNextcloudUploader(NextcloudUploader):
+    """Upload files to Nextcloud public shares via WebDAV, asynchronously.
+
+    One aiohttp session (and its connection pool) is shared across all
+    uploads, so batch uploads of many files amortize the TCP/TLS setup
+    and overlap disk reads with socket writes on the event loop.
+    """
+
+    def __init__(
+        self,
+        share_url: str,
+        password: Optional[str] = None,
+        connection_limit: int = 8,
+    ) -> None:
+        """Initialize the async uploader.
+
+        Args:
+            share_url: The public share URL (e.g., https://cloud.example.com/s/TOKEN)
+            password: Optional password for password-protected shares
+            connection_limit: Maximum concurrent connections (default 8)
+
+        Raises:
+            ImportError: If the optional async dependencies are missing
+        """
+        if aiohttp is None or aiofiles is None:
+            raise ImportError(
+                "aiohttp and aiofiles are required for async uploads; "
+                "install with: pip install nextcloudcli[async]"
+            )
+        super().__init__(share_url, password)
+        self._connection_limit = connection_limit
+        self._aio_session: Optional[aiohttp.ClientSession] = None
+
+    def _get_aio_session(self) -> "aiohttp.ClientSession":
+        """Lazily create the shared aiohttp session.
+
+        Returns:
+            The shared aiohttp client session
+        """
+        if self._aio_session is None:
+            self._aio_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._connection_limit),
+                headers={
+                    "Content-Type": "application/octet-stream",
+                    "Authorization": self._auth_header,
+                },
+            )
+        return self._aio_session
+
+    async def upload_file_async(
+        self, file_path: Path, remote_name: Optional[str] = None
+    ) -> bool:
+        """Upload a single file to the Nextcloud share asynchronously.
+
+        Args:
+            file_path: Path to the local file to upload
+            remote_name: Optional remote filename (defaults to local filename)
+
+        Returns:
+            True if upload was successful, False otherwise
+
+        Raises:
+            FileNotFoundError: If the local file does not exist
+            aiohttp.ClientError: If the upload request fails
+        """
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        target_name = remote_name or file_path.name
+        upload_url = self.webdav_url + target_name
+        file_size = file_path.stat().st_size
+
+        logger.info("Uploading %s to %s", file_path, target_name)
+
+        session = self._get_aio_session()
+        try:
+            async with aiofiles.open(file_path, "rb") as f:
+                async with session.put(
+                    upload_url,
+                    data=_aiter_chunks(f),
+                    headers={"Content-Length": str(file_size)},
+                ) as response:
+                    if response.status in [200, 201, 204]:
+                        logger.info("Successfully uploaded %s", target_name)
+                        return True
+                    else:
+                        body = await response.text()
+                        logger.error(
+                            "Upload failed with status %s: %s",
+                            response.status,
+                            body,
+                        )
+                        return False
+
+        except aiohttp.ClientError as e:
+            logger.error("Upload failed: %s", e)
+            raise
+
+    async def upload_files_async(
+        self, file_paths: list[Path], concurrency: int = 4
+    ) -> list[Union[bool, BaseException]]:
+        """Upload multiple files concurrently over one session.
+
+        Args:
+            file_paths: Paths to the local files to upload
+            concurrency: Maximum number of uploads in flight (default 4)
+
+        Returns:
+            Per-file results in input order: True/False for completed
+            uploads, or the raised exception
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded_upload(path: Path) -> bool:
+            async with semaphore:
+                return await self.upload_file_async(path)
+
+        return await asyncio.gather(
+            *[bounded_upload(path) for path in file_paths],
+            return_exceptions=True,
+        )
+
+    async def aclose(self) -> None:
+        """Close the aiohttp session and the underlying requests session."""
+        if self._aio_session is not None:
+            await self._aio_session.close()
+            self._aio_session = None
+        self.close()
+
+    async def __aenter__(self) -> "AsyncNextcloudUploader":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
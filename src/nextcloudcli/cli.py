@@ -7,8 +7,6 @@ from typing import Optional
 
 import click
 
-from nextcloudcli.uploader import NextcloudUploader
-
 
 def setup_logging(verbose: bool = False, quiet: bool = False) -> None:
     """Configure logging based on verbosity flags.
@@ -32,6 +30,177 @@ def setup_logging(verbose: bool = False, quiet: bool = False) -> None:
     )
 
 
+def _upload_threaded(
+    share_url: str,
+    password: Optional[str],
+    files: "list[Path]",
+    concurrency: int,
+    quiet: bool,
+    connect_timeout: float,
+    read_timeout: float,
+) -> None:
+    """Upload files over a shared thread pool and exit with a summary.
+
+    One NextcloudUploader (and hence one requests session and its
+    connection pool) is shared by all worker threads, so the whole batch
+    pays for a single TCP/TLS handshake instead of one per file.
+
+    Args:
+        share_url: The public share URL
+        password: Optional password for password-protected shares
+        files: Paths to the local files to upload
+        concurrency: Maximum number of uploads in flight
+        quiet: Suppress per-run summary output
+        connect_timeout: Connection timeout in seconds
+        read_timeout: Read timeout in seconds
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from nextcloudcli.uploader import NextcloudUploader
+
+    logger = logging.getLogger(__name__)
+
+    def upload_one(uploader: NextcloudUploader, path: Path) -> bool:
+        try:
+            return uploader.upload_file(path, show_progress=False)
+        except Exception as e:
+            logger.error("Upload of %s failed: %s", path, e)
+            return False
+
+    with NextcloudUploader(
+        share_url,
+        password,
+        connect_timeout=connect_timeout,
+        read_timeout=read_timeout,
+    ) as uploader:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(
+                executor.map(lambda p: upload_one(uploader, p), files)
+            )
+
+    failed = sum(1 for result in results if not result)
+    if failed:
+        click.echo(
+            f"✗ Failed to upload {failed} of {len(files)} files", err=True
+        )
+        sys.exit(1)
+
+    if not quiet:
+        click.echo(f"✓ Successfully uploaded {len(files)} files")
+    sys.exit(0)
+
+
+def _upload_directory(
+    share_url: str,
+    password: Optional[str],
+    directory: Path,
+    concurrency: int,
+    quiet: bool,
+    connect_timeout: float,
+    read_timeout: float,
+) -> None:
+    """Upload every file under a directory and exit with a summary.
+
+    Args:
+        share_url: The public share URL
+        password: Optional password for password-protected shares
+        directory: Directory whose files are uploaded (recursively,
+            flattened to their basenames on the share)
+        concurrency: Maximum number of uploads in flight
+        quiet: Suppress per-run summary output
+        connect_timeout: Connection timeout in seconds
+        read_timeout: Read timeout in seconds
+    """
+    files = sorted(p for p in directory.rglob("*") if p.is_file())
+    if not files:
+        click.echo(f"✗ No files found under {directory}", err=True)
+        sys.exit(1)
+
+    _upload_threaded(
+        share_url,
+        password,
+        files,
+        concurrency,
+        quiet,
+        connect_timeout,
+        read_timeout,
+    )
+
+
+def _upload_batch(
+    share_url: str,
+    password: Optional[str],
+    file_paths: list[Path],
+    concurrency: int,
+    quiet: bool,
+    connect_timeout: float,
+    read_timeout: float,
+) -> None:
+    """Upload multiple files concurrently and exit with a summary.
+
+    Prefers the aiohttp-based async uploader; without the optional
+    ``async`` extra it degrades to the same thread pool that --dir uses.
+
+    Args:
+        share_url: The public share URL
+        password: Optional password for password-protected shares
+        file_paths: Paths to the local files to upload
+        concurrency: Maximum number of uploads in flight
+        quiet: Suppress per-run summary output
+        connect_timeout: Connection timeout in seconds
+        read_timeout: Read timeout in seconds
+    """
+    import asyncio
+
+    logger = logging.getLogger(__name__)
+
+    # Constructing eagerly surfaces the missing-extra ImportError here
+    # rather than inside the event loop
+    try:
+        from nextcloudcli.async_uploader import AsyncNextcloudUploader
+
+        async_uploader = AsyncNextcloudUploader(share_url, password)
+    except ImportError:
+        logger.debug("async extra not installed; using thread pool")
+        _upload_threaded(
+            share_url,
+            password,
+            file_paths,
+            concurrency,
+            quiet,
+            connect_timeout,
+            read_timeout,
+        )
+        return
+
+    async def run() -> list:
+        async with async_uploader as uploader:
+            return await uploader.upload_files_async(
+                file_paths, concurrency=concurrency
+            )
+
+    results = asyncio.run(run())
+
+    failures = []
+    for path, result in zip(file_paths, results):
+        if result is True:
+            continue
+        failures.append(path)
+        if isinstance(result, BaseException):
+            logger.error("Upload of %s failed: %s", path, result)
+
+    if failures:
+        click.echo(
+            f"✗ Failed to upload {len(failures)} of {len(file_paths)} files",
+            err=True,
+        )
+        sys.exit(1)
+
+    if not quiet:
+        click.echo(f"✓ Successfully uploaded {len(file_paths)} files")
+    sys.exit(0)
+
+
 @click.command()
 @click.option(
     "--share-url",
@@ -42,10 +211,18 @@ def setup_logging(verbose: bool = False, quiet: bool = False) -> None:
 @click.option(
     "--file",
     "-f",
-    "file_path",
-    required=True,
+    "file_paths",
+    multiple=True,
     type=click.Path(exists=True, path_type=Path),
-    help="Path to the file to upload",
+    help="Path to the file to upload (repeatable)",
+)
+@click.option(
+    "--dir",
+    "-d",
+    "directory",
+    default=None,
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    help="Upload every file under this directory (recursively)",
 )
 @click.option(
     "--password",
@@ -57,7 +234,10 @@ def setup_logging(verbose: bool = False, quiet: bool = False) -> None:
     "--remote-name",
     "-n",
     default=None,
-    help="Remote filename (defaults to local filename)",
+    help=(
+        "Remote filename (defaults to local filename; ignored when "
+        "uploading multiple files or with --dir)"
+    ),
 )
 @click.option(
     "--verbose",
@@ -77,15 +257,38 @@ def setup_logging(verbose: bool = False, quiet: bool = False) -> None:
     is_flag=True,
     help="Test connection to share without uploading",
 )
+@click.option(
+    "--concurrency",
+    "-c",
+    default=4,
+    show_default=True,
+    help="Maximum concurrent uploads when multiple files are given",
+)
+@click.option(
+    "--connect-timeout",
+    default=10.0,
+    show_default=True,
+    help="Connection timeout in seconds",
+)
+@click.option(
+    "--read-timeout",
+    default=300.0,
+    show_default=True,
+    help="Read timeout in seconds (generous so large uploads survive)",
+)
 @click.version_option(version="0.1.0", prog_name="nextcloud-upload")
 def main(
     share_url: str,
-    file_path: Path,
+    file_paths: tuple[Path, ...],
+    directory: Optional[Path],
     password: Optional[str],
     remote_name: Optional[str],
     verbose: bool,
     quiet: bool,
     test_connection: bool,
+    concurrency: int,
+    connect_timeout: float,
+    read_timeout: float,
 ) -> None:
     """Upload files to Nextcloud public shares via WebDAV.
 
@@ -106,33 +309,80 @@ def main(
 
         # Test connection without uploading
         nextcloud-upload -u https://cloud.example.com/s/TOKEN -f dummy.txt -t
+
+        # Upload every file in a directory over one shared connection pool
+        nextcloud-upload -u https://cloud.example.com/s/TOKEN -d ./photos
     """
     # Setup logging
     setup_logging(verbose=verbose, quiet=quiet)
     logger = logging.getLogger(__name__)
 
+    if bool(file_paths) == (directory is not None):
+        raise click.UsageError("Exactly one of --file or --dir is required.")
+
+    # Imported here so --help/--version don't pay for requests and its
+    # transitive imports
+    from nextcloudcli.uploader import NextcloudUploader
+
     try:
-        # Initialize uploader
-        logger.debug(f"Initializing uploader for share: {share_url}")
-        uploader = NextcloudUploader(share_url, password)
-
-        # Test connection if requested
-        if test_connection:
-            logger.info("Testing connection to share...")
-            if uploader.test_connection():
-                click.echo("✓ Connection successful", err=quiet)
-                sys.exit(0)
-            else:
-                click.echo("✗ Connection failed", err=True)
-                sys.exit(1)
-
-        # Upload file
-        logger.info(f"Starting upload of {file_path}")
-        # Show progress bar unless in quiet mode or not in a terminal
-        show_progress = not quiet and sys.stdout.isatty()
-        success = uploader.upload_file(
-            file_path, remote_name, show_progress=show_progress
-        )
+        # A directory upload shares one uploader (one session/pool) across
+        # a bounded thread pool
+        if directory is not None and not test_connection:
+            _upload_directory(
+                share_url,
+                password,
+                directory,
+                concurrency,
+                quiet,
+                connect_timeout,
+                read_timeout,
+            )
+
+        # Multiple files go through the async uploader so one connection
+        # pool is shared across all uploads
+        if len(file_paths) > 1 and not test_connection:
+            _upload_batch(
+                share_url,
+                password,
+                list(file_paths),
+                concurrency,
+                quiet,
+                connect_timeout,
+                read_timeout,
+            )
+
+        file_path = file_paths[0] if file_paths else None
+
+        # Initialize uploader; the context manager closes its HTTP session
+        logger.debug("Initializing uploader for share: %s", share_url)
+        with NextcloudUploader(
+            share_url,
+            password,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+        ) as uploader:
+            # Test connection if requested
+            if test_connection:
+                logger.info("Testing connection to share...")
+                if uploader.test_connection():
+                    click.echo("✓ Connection successful", err=quiet)
+                    sys.exit(0)
+                else:
+                    click.echo("✗ Connection failed", err=True)
+                    sys.exit(1)
+
+            # Directory and batch modes exit inside their helpers above
+            # and --test-connection exits just before this point, so only
+            # single-file mode reaches the upload below
+            assert file_path is not None
+
+            # Upload file
+            logger.info("Starting upload of %s", file_path)
+            # Show progress bar unless in quiet mode or not in a terminal
+            show_progress = not quiet and sys.stdout.isatty()
+            success = uploader.upload_file(
+                file_path, remote_name, show_progress=show_progress
+            )
 
         if success:
             if not quiet:
@@ -143,17 +393,17 @@ def main(
             sys.exit(1)
 
     except FileNotFoundError as e:
-        logger.error(f"File not found: {e}")
+        logger.error("File not found: %s", e)
         click.echo(f"✗ Error: {e}", err=True)
         sys.exit(1)
 
     except ValueError as e:
-        logger.error(f"Invalid share URL: {e}")
+        logger.error("Invalid share URL: %s", e)
         click.echo(f"✗ Error: {e}", err=True)
         sys.exit(1)
 
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=verbose)
+        logger.error("Unexpected error: %s", e, exc_info=verbose)
         click.echo(f"✗ Error: {e}", err=True)
         sys.exit(1)
 
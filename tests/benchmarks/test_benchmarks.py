@@ -0,0 +1,30 @@
+"""Opt-in performance benchmarks.
+
+Skipped during normal runs via --benchmark-skip in addopts; run with:
+
+    pytest --benchmark-only tests/benchmarks/
+"""
+
+from click.testing import CliRunner
+
+from nextcloudcli.cli import main
+from nextcloudcli.uploader import NextcloudUploader
+
+
+def test_cli_help(benchmark) -> None:
+    """Benchmark a full CLI --help round trip."""
+    runner = CliRunner()
+
+    result = benchmark(lambda: runner.invoke(main, ["--help"]))
+
+    assert result.exit_code == 0
+
+
+def test_uploader_construction(benchmark, sample_share_url: str) -> None:
+    """Benchmark NextcloudUploader construction (URL parse + session)."""
+
+    def construct() -> None:
+        with NextcloudUploader(sample_share_url):
+            pass
+
+    benchmark(construct)
@@ -1,57 +1,93 @@
 """Pytest configuration and shared fixtures for nextcloudcli tests."""
 
+import os
+import shutil
+from collections.abc import Generator
 from pathlib import Path
-from typing import Generator
+from unittest.mock import patch
 
 import pytest
+import requests
 
+# The URL/password fixtures are immutable strings, so they are created
+# once per session instead of once per test
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_share_url() -> str:
     """Return a sample Nextcloud share URL."""
     return "https://cloud.example.com/nextcloud/s/TestToken123"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_share_url() -> str:
     """Return a simple Nextcloud share URL without nextcloud path."""
     return "https://cloud.example.com/s/SimpleToken"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def share_password() -> str:
     """Return a sample share password."""
     return "test_password_123"
 
 
+# Template files are written once per session; the per-test fixtures
+# below only copy them, so each test pays one copyfile instead of
+# regenerating content
+
+
+@pytest.fixture(scope="session")
+def _temp_file_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create the session-wide template for temp_file."""
+    template = tmp_path_factory.mktemp("templates") / "test_upload.txt"
+    template.write_text("This is a test file for upload testing.\n")
+    return template
+
+
+@pytest.fixture(scope="session")
+def _temp_binary_file_template(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Path:
+    """Create the session-wide template for temp_binary_file."""
+    template = tmp_path_factory.mktemp("templates") / "test_binary.bin"
+    template.write_bytes(b"\x00\x01\x02\x03\x04\x05" * 100)
+    return template
+
+
 @pytest.fixture
-def temp_file(tmp_path: Path) -> Generator[Path, None, None]:
+def temp_file(
+    tmp_path: Path, _temp_file_template: Path
+) -> Generator[Path, None, None]:
     """Create a temporary test file.
 
     Args:
         tmp_path: Pytest's temporary directory fixture
+        _temp_file_template: Session-scoped template to copy
 
     Yields:
         Path to the temporary test file
     """
     test_file = tmp_path / "test_upload.txt"
-    test_file.write_text("This is a test file for upload testing.\n")
+    shutil.copyfile(_temp_file_template, test_file)
     yield test_file
     # Cleanup happens automatically with tmp_path
 
 
 @pytest.fixture
-def temp_binary_file(tmp_path: Path) -> Generator[Path, None, None]:
+def temp_binary_file(
+    tmp_path: Path, _temp_binary_file_template: Path
+) -> Generator[Path, None, None]:
     """Create a temporary binary test file.
 
     Args:
         tmp_path: Pytest's temporary directory fixture
+        _temp_binary_file_template: Session-scoped template to copy
 
     Yields:
         Path to the temporary binary test file
     """
     test_file = tmp_path / "test_binary.bin"
-    test_file.write_bytes(b"\x00\x01\x02\x03\x04\x05" * 100)
+    shutil.copyfile(_temp_binary_file_template, test_file)
     yield test_file
 
 
@@ -66,70 +102,125 @@ def large_temp_file(tmp_path: Path) -> Generator[Path, None, None]:
         Path to the large temporary test file
     """
     test_file = tmp_path / "large_file.dat"
-    # Create 1 MB file
-    test_file.write_bytes(b"X" * (1024 * 1024))
+    # Allocate 1 MB directly in the kernel instead of building a 1 MB
+    # bytes object in Python; content is zeros, which no test inspects
+    fd = os.open(test_file, os.O_CREAT | os.O_WRONLY, 0o644)
+    try:
+        if hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(fd, 0, 1 << 20)
+        else:  # pragma: no cover - non-POSIX fallback
+            os.truncate(fd, 1 << 20)
+    finally:
+        os.close(fd)
     yield test_file
 
 
-@pytest.fixture
-def mock_successful_response(mocker):
-    """Mock a successful HTTP response.
+def _make_response(status_code: int, content: bytes = b"") -> requests.Response:
+    """Build a real requests.Response with the given status and body.
+
+    Real Response objects have plain attribute access, which is far
+    cheaper under test than MagicMock's auto-generated accessors. The
+    attached PreparedRequest keeps the uploader's request-header debug
+    logging working.
 
     Args:
-        mocker: pytest-mock fixture
+        status_code: HTTP status code for the response
+        content: Raw response body
 
     Returns:
-        Mocked response object with status 201
+        A populated requests.Response instance
     """
-    mock_response = mocker.Mock()
-    mock_response.status_code = 201
-    mock_response.text = ""
-    return mock_response
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.request = requests.PreparedRequest()
+    response.request.headers = requests.structures.CaseInsensitiveDict()
+    return response
 
 
 @pytest.fixture
-def mock_auth_error_response(mocker):
-    """Mock an authentication error response.
+def patched_put(request):
+    """Patch requests.Session.put with a canned response.
+
+    Defaults to a 201 Created response. Tests needing another status
+    code parametrize this fixture indirectly, e.g.
+    ``@pytest.mark.parametrize("patched_put", [401], indirect=True)``.
+    Uses unittest.mock directly to skip the pytest-mock bookkeeping on
+    this hot path.
 
     Args:
-        mocker: pytest-mock fixture
+        request: Fixture request carrying the optional status code
 
-    Returns:
-        Mocked response object with status 401
+    Yields:
+        The patching MagicMock, for call assertions
     """
-    mock_response = mocker.Mock()
-    mock_response.status_code = 401
-    mock_response.text = "Unauthorized"
-    return mock_response
+    status_code = getattr(request, "param", 201)
+    content = b"" if status_code < 400 else b"Error"
+    response = _make_response(status_code, content)
+    with patch("requests.Session.put", return_value=response) as mock_put:
+        yield mock_put
 
 
-@pytest.fixture
-def mock_permission_error_response(mocker):
-    """Mock a permission denied response.
+@pytest.fixture(scope="session")
+def default_uploader(sample_share_url: str):
+    """Provide a session-wide uploader for tests that send no requests.
+
+    Suitable for error paths (missing files, bad arguments) that never
+    touch the network; tests that mutate the uploader or assert on its
+    session must construct their own.
 
     Args:
-        mocker: pytest-mock fixture
+        sample_share_url: Session-scoped share URL fixture
+
+    Yields:
+        A shared NextcloudUploader instance
+    """
+    # Imported here to keep conftest import time off collection
+    from nextcloudcli.uploader import NextcloudUploader
+
+    with NextcloudUploader(sample_share_url) as uploader:
+        yield uploader
+
+
+# Tests only read status_code/text off these responses, so one real
+# Response per session replaces a fresh mock per test
+
+
+@pytest.fixture(scope="session")
+def mock_successful_response() -> requests.Response:
+    """Mock a successful HTTP response.
 
     Returns:
-        Mocked response object with status 403
+        Response with status 201
     """
-    mock_response = mocker.Mock()
-    mock_response.status_code = 403
-    mock_response.text = "Forbidden"
-    return mock_response
+    return _make_response(201)
 
 
-@pytest.fixture
-def mock_propfind_response(mocker):
-    """Mock a successful PROPFIND response for connection testing.
+@pytest.fixture(scope="session")
+def mock_auth_error_response() -> requests.Response:
+    """Mock an authentication error response.
 
-    Args:
-        mocker: pytest-mock fixture
+    Returns:
+        Response with status 401
+    """
+    return _make_response(401, b"Unauthorized")
+
+
+@pytest.fixture(scope="session")
+def mock_permission_error_response() -> requests.Response:
+    """Mock a permission denied response.
+
+    Returns:
+        Response with status 403
+    """
+    return _make_response(403, b"Forbidden")
+
+
+@pytest.fixture(scope="session")
+def mock_propfind_response() -> requests.Response:
+    """Mock a successful PROPFIND response for connection testing.
 
     Returns:
-        Mocked response object with status 207
+        Response with status 207
     """
-    mock_response = mocker.Mock()
-    mock_response.status_code = 207
-    mock_response.text = '<?xml version="1.0"?><d:multistatus/>'
-    return mock_response
+    return _make_response(207, b'<?xml version="1.0"?><d:multistatus/>')
@@ -0,0 +1,156 @@
+"""Unit tests for the AsyncNextcloudUploader class."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp", reason="requires the async extra")
+pytest.importorskip("aiofiles", reason="requires the async extra")
+
+from nextcloudcli.async_uploader import (  # noqa: E402
+    AsyncNextcloudUploader,
+    _aiter_chunks,
+)
+
+
+class TestAsyncNextcloudUploaderInit:
+    """Test AsyncNextcloudUploader initialization."""
+
+    def test_init_parses_share_url(self, sample_share_url: str) -> None:
+        """Test that initialization reuses the sync URL parsing."""
+        uploader = AsyncNextcloudUploader(sample_share_url)
+
+        assert uploader.share_token == "TestToken123"
+        assert uploader.base_url == "https://cloud.example.com/nextcloud"
+
+    def test_init_session_is_lazy(self, sample_share_url: str) -> None:
+        """Test that no aiohttp session is created at construction."""
+        uploader = AsyncNextcloudUploader(sample_share_url)
+
+        assert uploader._aio_session is None
+
+
+class _FakeResponse:
+    """Minimal stand-in for an aiohttp response context manager."""
+
+    def __init__(self, status: int, text: str = "") -> None:
+        self.status = status
+        self._text = text
+
+    async def text(self) -> str:
+        return self._text
+
+    async def __aenter__(self) -> "_FakeResponse":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        pass
+
+
+class _FakeSession:
+    """Minimal stand-in for an aiohttp client session."""
+
+    def __init__(self, response: _FakeResponse) -> None:
+        self._response = response
+        self.put_calls: list = []
+
+    def put(self, url: str, **kwargs: object) -> _FakeResponse:
+        self.put_calls.append((url, kwargs))
+        return self._response
+
+    async def close(self) -> None:
+        pass
+
+
+class TestUploadFileAsync:
+    """Test asynchronous file upload functionality."""
+
+    def test_upload_success(
+        self, sample_share_url: str, temp_file, mocker
+    ) -> None:
+        """Test successful async upload."""
+        uploader = AsyncNextcloudUploader(sample_share_url)
+        session = _FakeSession(_FakeResponse(201))
+        mocker.patch.object(uploader, "_get_aio_session", return_value=session)
+
+        result = asyncio.run(uploader.upload_file_async(temp_file))
+
+        assert result is True
+        assert len(session.put_calls) == 1
+        url, kwargs = session.put_calls[0]
+        assert temp_file.name in url
+        assert kwargs["headers"]["Content-Length"] == str(
+            temp_file.stat().st_size
+        )
+
+    def test_upload_failure(
+        self, sample_share_url: str, temp_file, mocker
+    ) -> None:
+        """Test async upload with an error response."""
+        uploader = AsyncNextcloudUploader(sample_share_url)
+        session = _FakeSession(_FakeResponse(401, "Unauthorized"))
+        mocker.patch.object(uploader, "_get_aio_session", return_value=session)
+
+        result = asyncio.run(uploader.upload_file_async(temp_file))
+
+        assert result is False
+
+    def test_upload_file_not_found(self, sample_share_url: str) -> None:
+        """Test async upload with non-existent file."""
+        from pathlib import Path
+
+        uploader = AsyncNextcloudUploader(sample_share_url)
+
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(
+                uploader.upload_file_async(Path("/tmp/nonexistent_12345.txt"))
+            )
+
+    def test_upload_many_files(
+        self, sample_share_url: str, temp_file, temp_binary_file, mocker
+    ) -> None:
+        """Test concurrent upload of multiple files."""
+        uploader = AsyncNextcloudUploader(sample_share_url)
+        session = _FakeSession(_FakeResponse(201))
+        mocker.patch.object(uploader, "_get_aio_session", return_value=session)
+
+        results = asyncio.run(
+            uploader.upload_files_async([temp_file, temp_binary_file])
+        )
+
+        assert results == [True, True]
+        assert len(session.put_calls) == 2
+
+    def test_context_manager_closes_session(
+        self, sample_share_url: str
+    ) -> None:
+        """Test that the async context manager closes the session."""
+
+        async def run() -> AsyncNextcloudUploader:
+            async with AsyncNextcloudUploader(sample_share_url) as uploader:
+                uploader._get_aio_session()
+            return uploader
+
+        uploader = asyncio.run(run())
+
+        assert uploader._aio_session is None
+
+
+class TestAiterChunks:
+    """Test the async chunk iterator."""
+
+    def test_yields_until_eof(self) -> None:
+        """Test that chunks are yielded until the file is exhausted."""
+
+        class FakeAsyncFile:
+            def __init__(self, chunks: list) -> None:
+                self._chunks = chunks
+
+            async def read(self, size: int) -> bytes:
+                return self._chunks.pop(0) if self._chunks else b""
+
+        async def collect() -> list:
+            fake = FakeAsyncFile([b"abc", b"def"])
+            return [chunk async for chunk in _aiter_chunks(fake)]
+
+        assert asyncio.run(collect()) == [b"abc", b"def"]
@@ -1,21 +1,40 @@
 """Unit tests for the CLI interface."""
 
 from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
 
 import pytest
-from click.testing import CliRunner
+from click.testing import CliRunner, Result
 
 from nextcloudcli.cli import main
 
 
-@pytest.fixture
+class _FastCliRunner(CliRunner):
+    """CliRunner that skips traceback capture unless asked for it.
+
+    Click's default ``catch_exceptions=True`` wraps every invocation in
+    exception hooks and traceback formatting that the success-path
+    tests never look at. Tests that want the captured exception can
+    still pass ``catch_exceptions=True`` explicitly.
+    """
+
+    def invoke(self, *args: Any, **kwargs: Any) -> Result:
+        kwargs.setdefault("catch_exceptions", False)
+        return super().invoke(*args, **kwargs)
+
+
+@pytest.fixture(scope="session")
 def cli_runner() -> CliRunner:
-    """Create a Click CLI test runner.
+    """Create a Click CLI test runner, shared across the session.
+
+    CliRunner keeps no state between invocations, so one instance can
+    serve every test.
 
     Returns:
         CliRunner instance for testing CLI commands
     """
-    return CliRunner()
+    return _FastCliRunner()
 
 
 class TestCLIHelp:
@@ -85,12 +104,9 @@ class TestCLISuccessfulUpload:
         cli_runner: CliRunner,
         sample_share_url: str,
         temp_file: Path,
-        mock_successful_response,
-        mocker,
+        patched_put,
     ) -> None:
         """Test basic successful upload."""
-        mocker.patch("requests.put", return_value=mock_successful_response)
-
         result = cli_runner.invoke(
             main, ["--share-url", sample_share_url, "--file", str(temp_file)]
         )
@@ -104,12 +120,9 @@ class TestCLISuccessfulUpload:
         sample_share_url: str,
         temp_file: Path,
         share_password: str,
-        mock_successful_response,
-        mocker,
+        patched_put,
     ) -> None:
         """Test upload with password."""
-        mocker.patch("requests.put", return_value=mock_successful_response)
-
         result = cli_runner.invoke(
             main,
             [
@@ -130,12 +143,9 @@ class TestCLISuccessfulUpload:
         cli_runner: CliRunner,
         sample_share_url: str,
         temp_file: Path,
-        mock_successful_response,
-        mocker,
+        patched_put,
     ) -> None:
         """Test upload with custom remote name."""
-        mocker.patch("requests.put", return_value=mock_successful_response)
-
         result = cli_runner.invoke(
             main,
             [
@@ -156,12 +166,9 @@ class TestCLISuccessfulUpload:
         cli_runner: CliRunner,
         sample_share_url: str,
         temp_file: Path,
-        mock_successful_response,
-        mocker,
+        patched_put,
     ) -> None:
         """Test upload in quiet mode."""
-        mocker.patch("requests.put", return_value=mock_successful_response)
-
         result = cli_runner.invoke(
             main,
             ["--share-url", sample_share_url, "--file", str(temp_file), "--quiet"],
@@ -175,12 +182,9 @@ class TestCLISuccessfulUpload:
         cli_runner: CliRunner,
         sample_share_url: str,
         temp_file: Path,
-        mock_successful_response,
-        mocker,
+        patched_put,
     ) -> None:
         """Test upload in verbose mode."""
-        mocker.patch("requests.put", return_value=mock_successful_response)
-
         result = cli_runner.invoke(
             main,
             ["--share-url", sample_share_url, "--file", str(temp_file), "--verbose"],
@@ -199,21 +203,21 @@ class TestCLIConnectionTest:
         sample_share_url: str,
         temp_file: Path,
         mock_propfind_response,
-        mocker,
     ) -> None:
         """Test successful connection test."""
-        mocker.patch("requests.request", return_value=mock_propfind_response)
-
-        result = cli_runner.invoke(
-            main,
-            [
-                "--share-url",
-                sample_share_url,
-                "--file",
-                str(temp_file),
-                "--test-connection",
-            ],
-        )
+        with patch(
+            "requests.Session.request", return_value=mock_propfind_response
+        ):
+            result = cli_runner.invoke(
+                main,
+                [
+                    "--share-url",
+                    sample_share_url,
+                    "--file",
+                    str(temp_file),
+                    "--test-connection",
+                ],
+            )
 
         assert result.exit_code == 0
         assert "Connection successful" in result.output
@@ -223,22 +227,22 @@ class TestCLIConnectionTest:
         cli_runner: CliRunner,
         sample_share_url: str,
         temp_file: Path,
-        mock_auth_error_response,
-        mocker,
     ) -> None:
         """Test failed connection test."""
-        mocker.patch("requests.request", return_value=mock_auth_error_response)
-
-        result = cli_runner.invoke(
-            main,
-            [
-                "--share-url",
-                sample_share_url,
-                "--file",
-                str(temp_file),
-                "--test-connection",
-            ],
-        )
+        mock_response = MagicMock()
+        mock_response.status_code = 500
+        mock_response.text = "Internal Server Error"
+        with patch("requests.Session.request", return_value=mock_response):
+            result = cli_runner.invoke(
+                main,
+                [
+                    "--share-url",
+                    sample_share_url,
+                    "--file",
+                    str(temp_file),
+                    "--test-connection",
+                ],
+            )
 
         assert result.exit_code == 1
         assert "Connection failed" in result.output
@@ -247,17 +251,15 @@ class TestCLIConnectionTest:
 class TestCLIUploadFailures:
     """Test upload failure scenarios."""
 
+    @pytest.mark.parametrize("patched_put", [401], indirect=True)
     def test_upload_auth_failure(
         self,
         cli_runner: CliRunner,
         sample_share_url: str,
         temp_file: Path,
-        mock_auth_error_response,
-        mocker,
+        patched_put,
     ) -> None:
         """Test upload with authentication failure."""
-        mocker.patch("requests.put", return_value=mock_auth_error_response)
-
         result = cli_runner.invoke(
             main, ["--share-url", sample_share_url, "--file", str(temp_file)]
         )
@@ -265,17 +267,15 @@ class TestCLIUploadFailures:
         assert result.exit_code == 1
         assert "Failed to upload" in result.output
 
+    @pytest.mark.parametrize("patched_put", [403], indirect=True)
     def test_upload_permission_failure(
         self,
         cli_runner: CliRunner,
         sample_share_url: str,
         temp_file: Path,
-        mock_permission_error_response,
-        mocker,
+        patched_put,
     ) -> None:
         """Test upload with permission error."""
-        mocker.patch("requests.put", return_value=mock_permission_error_response)
-
         result = cli_runner.invoke(
             main, ["--share-url", sample_share_url, "--file", str(temp_file)]
         )
@@ -289,7 +289,13 @@ class TestCLIUploadFailures:
         """Test upload with invalid share URL."""
         result = cli_runner.invoke(
             main,
-            ["--share-url", "https://invalid.com/not/a/share", "--file", str(temp_file)],
+            [
+                "--share-url",
+                "https://invalid.com/not/a/share",
+                "--file",
+                str(temp_file),
+            ],
+            catch_exceptions=True,
         )
 
         assert result.exit_code == 1
@@ -304,12 +310,9 @@ class TestCLIShortOptions:
         cli_runner: CliRunner,
         sample_share_url: str,
         temp_file: Path,
-        mock_successful_response,
-        mocker,
+        patched_put,
     ) -> None:
         """Test using short option flags."""
-        mocker.patch("requests.put", return_value=mock_successful_response)
-
         result = cli_runner.invoke(
             main, ["-u", sample_share_url, "-f", str(temp_file)]
         )
@@ -322,12 +325,9 @@ class TestCLIShortOptions:
         cli_runner: CliRunner,
         sample_share_url: str,
         temp_file: Path,
-        mock_successful_response,
-        mocker,
+        patched_put,
     ) -> None:
         """Test -v short flag for verbose."""
-        mocker.patch("requests.put", return_value=mock_successful_response)
-
         result = cli_runner.invoke(
             main, ["-u", sample_share_url, "-f", str(temp_file), "-v"]
         )
@@ -339,14 +339,110 @@ class TestCLIShortOptions:
         cli_runner: CliRunner,
         sample_share_url: str,
         temp_file: Path,
-        mock_successful_response,
-        mocker,
+        patched_put,
     ) -> None:
         """Test -q short flag for quiet."""
-        mocker.patch("requests.put", return_value=mock_successful_response)
-
         result = cli_runner.invoke(
             main, ["-u", sample_share_url, "-f", str(temp_file), "-q"]
         )
 
         assert result.exit_code == 0
+
+
+class TestCLIDirectoryUpload:
+    """Test the --dir batch upload mode."""
+
+    def test_directory_upload_success(
+        self,
+        cli_runner: CliRunner,
+        sample_share_url: str,
+        tmp_path: Path,
+        patched_put,
+    ) -> None:
+        """Test uploading every file under a directory."""
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "b.txt").write_text("b")
+
+        result = cli_runner.invoke(
+            main, ["-u", sample_share_url, "--dir", str(tmp_path)]
+        )
+
+        assert result.exit_code == 0
+        assert "Successfully uploaded 2 files" in result.output
+        assert patched_put.call_count == 2
+
+    @pytest.mark.parametrize("patched_put", [500], indirect=True)
+    def test_directory_upload_failure(
+        self,
+        cli_runner: CliRunner,
+        sample_share_url: str,
+        tmp_path: Path,
+        patched_put,
+    ) -> None:
+        """Test summary and exit code when uploads fail."""
+        (tmp_path / "a.txt").write_text("a")
+
+        result = cli_runner.invoke(
+            main, ["-u", sample_share_url, "--dir", str(tmp_path)]
+        )
+
+        assert result.exit_code == 1
+        assert "Failed to upload 1 of 1 files" in result.output
+
+    def test_empty_directory(
+        self, cli_runner: CliRunner, sample_share_url: str, tmp_path: Path
+    ) -> None:
+        """Test error when the directory contains no files."""
+        result = cli_runner.invoke(
+            main, ["-u", sample_share_url, "--dir", str(tmp_path)]
+        )
+
+        assert result.exit_code == 1
+        assert "No files found" in result.output
+
+    def test_batch_upload_falls_back_without_async_extra(
+        self,
+        cli_runner: CliRunner,
+        sample_share_url: str,
+        tmp_path: Path,
+        patched_put,
+    ) -> None:
+        """Test that multiple -f files upload even without aiohttp."""
+        first = tmp_path / "a.txt"
+        second = tmp_path / "b.txt"
+        first.write_text("a")
+        second.write_text("b")
+
+        with patch("nextcloudcli.async_uploader.aiohttp", None):
+            result = cli_runner.invoke(
+                main,
+                ["-u", sample_share_url, "-f", str(first), "-f", str(second)],
+            )
+
+        assert result.exit_code == 0
+        assert "Successfully uploaded 2 files" in result.output
+        assert patched_put.call_count == 2
+
+    def test_file_and_dir_are_exclusive(
+        self,
+        cli_runner: CliRunner,
+        sample_share_url: str,
+        temp_file: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test that --file and --dir cannot be combined."""
+        result = cli_runner.invoke(
+            main,
+            [
+                "-u",
+                sample_share_url,
+                "-f",
+                str(temp_file),
+                "--dir",
+                str(tmp_path),
+            ],
+        )
+
+        assert result.exit_code != 0
+        assert "Exactly one of --file or --dir" in result.output
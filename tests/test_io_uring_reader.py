@@ -0,0 +1,111 @@
+"""Tests for the optional io_uring-backed file reader."""
+
+import os
+
+import pytest
+
+from nextcloudcli import _io_uring_reader
+
+liburing = pytest.importorskip("liburing")
+
+
+@pytest.fixture
+def sample_file(tmp_path):
+    """Create a multi-window file with a ragged tail."""
+    path = tmp_path / "sample.bin"
+    data = os.urandom(2 * _io_uring_reader._WINDOW_SIZE + 12345)
+    path.write_bytes(data)
+    return path, data
+
+
+class TestAvailable:
+    """Test cases for io_uring availability detection."""
+
+    def test_available_with_liburing(self):
+        """available() is True when liburing is importable."""
+        assert _io_uring_reader.available() is True
+
+    def test_available_without_liburing(self, monkeypatch):
+        """available() is False when liburing is missing."""
+        monkeypatch.setattr(_io_uring_reader, "liburing", None)
+        assert _io_uring_reader.available() is False
+
+    def test_available_false_when_ring_setup_fails(self, monkeypatch):
+        """available() is False when the kernel blocks io_uring."""
+
+        def raise_eperm(depth, ring):
+            raise PermissionError(1, "Operation not permitted")
+
+        monkeypatch.setattr(_io_uring_reader, "_probe_result", None)
+        monkeypatch.setattr(
+            _io_uring_reader.liburing, "io_uring_queue_init", raise_eperm
+        )
+        assert _io_uring_reader.available() is False
+
+    def test_probe_result_is_cached(self, monkeypatch):
+        """A cached probe result short-circuits the ring setup."""
+
+        def raise_eperm(depth, ring):
+            raise PermissionError(1, "Operation not permitted")
+
+        monkeypatch.setattr(_io_uring_reader, "_probe_result", True)
+        monkeypatch.setattr(
+            _io_uring_reader.liburing, "io_uring_queue_init", raise_eperm
+        )
+        assert _io_uring_reader.available() is True
+
+    def test_init_without_liburing(self, monkeypatch, sample_file):
+        """Constructing the reader without liburing raises ImportError."""
+        path, data = sample_file
+        monkeypatch.setattr(_io_uring_reader, "liburing", None)
+        with pytest.raises(ImportError, match="liburing is required"):
+            _io_uring_reader.IoUringReader(path, len(data))
+
+
+class TestIoUringReader:
+    """Test cases for IoUringReader."""
+
+    def test_reads_match_plain_file(self, sample_file):
+        """Windowed reads return exactly the file content, in order."""
+        path, data = sample_file
+        reader = _io_uring_reader.IoUringReader(path, len(data))
+        try:
+            assert reader.readable() is True
+            out = b""
+            while True:
+                chunk = reader.read(_io_uring_reader._WINDOW_SIZE)
+                if not chunk:
+                    break
+                out += chunk
+            assert out == data
+        finally:
+            reader.close()
+
+    def test_read_default_size(self, sample_file):
+        """read() without a size returns one prefetch window."""
+        path, data = sample_file
+        with _io_uring_reader.IoUringReader(path, len(data)) as reader:
+            chunk = reader.read()
+            assert chunk == data[: _io_uring_reader._WINDOW_SIZE]
+
+    def test_read_small_sizes(self, sample_file):
+        """Reads smaller than a window drain the leftover buffer."""
+        path, data = sample_file
+        with _io_uring_reader.IoUringReader(path, len(data)) as reader:
+            assert reader.read(10) == data[:10]
+            assert reader.read(10) == data[10:20]
+
+    def test_empty_file(self, tmp_path):
+        """An empty file yields EOF immediately."""
+        path = tmp_path / "empty.bin"
+        path.write_bytes(b"")
+        with _io_uring_reader.IoUringReader(path, 0) as reader:
+            assert reader.read(1024) == b""
+
+    def test_close_is_idempotent(self, sample_file):
+        """close() can be called more than once."""
+        path, data = sample_file
+        reader = _io_uring_reader.IoUringReader(path, len(data))
+        reader.close()
+        reader.close()
+        assert reader.closed
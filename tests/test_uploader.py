@@ -1,6 +1,9 @@
 """Unit tests for the NextcloudUploader class."""
 
+import base64
+import io
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
@@ -8,6 +11,52 @@ import requests
 from nextcloudcli.uploader import NextcloudUploader
 
 
+class DummySession:
+    """Minimal requests.Session stand-in for direct injection.
+
+    Assigning an instance to ``uploader._session`` replaces the real
+    session without any patch/unpatch bookkeeping. Responses come from
+    ``response`` (or ``error`` to raise); calls are recorded as
+    (method, url) tuples for assertions.
+    """
+
+    def __init__(self, response=None, error=None):
+        self.response = response
+        self.error = error
+        self.calls = []
+
+    def put(self, url, data=None, headers=None, timeout=None):
+        self.calls.append(("PUT", url))
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+    def request(self, method, url, headers=None, timeout=None):
+        self.calls.append((method, url))
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+    def close(self):
+        pass
+
+
+class TestModuleLayout:
+    """Guard against duplicated or regressed uploader module definitions."""
+
+    def test_only_one_uploader_module(self) -> None:
+        """Test that the canonical streaming uploader module is loaded."""
+        import inspect
+
+        from nextcloudcli import uploader as uploader_module
+
+        source = inspect.getsourcefile(NextcloudUploader)
+        assert source == uploader_module.__file__
+        # The streaming progress wrapper must be present; its absence
+        # would mean the non-streaming variant won the import
+        assert hasattr(uploader_module, "_ProgressReader")
+
+
 class TestNextcloudUploaderInit:
     """Test NextcloudUploader initialization."""
 
@@ -36,301 +85,440 @@ class TestNextcloudUploaderInit:
         assert uploader.base_url == "https://cloud.example.com"
 
 
-class TestExtractShareToken:
-    """Test share token extraction from URLs."""
-
-    def test_extract_token_standard_url(self) -> None:
-        """Test extracting token from standard URL."""
-        uploader = NextcloudUploader("https://cloud.example.com/s/ABC123")
-        assert uploader.share_token == "ABC123"
-
-    def test_extract_token_nextcloud_path(self) -> None:
-        """Test extracting token from URL with /nextcloud path."""
-        uploader = NextcloudUploader(
-            "https://cloud.example.com/nextcloud/s/XYZ789"
-        )
-        assert uploader.share_token == "XYZ789"
-
-    def test_extract_token_trailing_slash(self) -> None:
-        """Test extracting token from URL with trailing slash."""
-        uploader = NextcloudUploader("https://cloud.example.com/s/TOKEN/")
-        assert uploader.share_token == "TOKEN"
-
-    def test_extract_token_invalid_url(self) -> None:
-        """Test that invalid URL raises ValueError."""
+class TestShareUrlParsing:
+    """Test share token, base URL and WebDAV URL parsing."""
+
+    @pytest.mark.parametrize(
+        ("url", "token", "base"),
+        [
+            (
+                "https://cloud.example.com/s/ABC123",
+                "ABC123",
+                "https://cloud.example.com",
+            ),
+            (
+                "https://cloud.example.com/nextcloud/s/XYZ789",
+                "XYZ789",
+                "https://cloud.example.com/nextcloud",
+            ),
+            (
+                "https://cloud.example.com/s/TOKEN/",
+                "TOKEN",
+                "https://cloud.example.com",
+            ),
+            (
+                "https://cloud.example.com:8443/s/TOKEN",
+                "TOKEN",
+                "https://cloud.example.com:8443",
+            ),
+            (
+                "https://example.com/cloud/nextcloud/s/TOKEN",
+                "TOKEN",
+                "https://example.com/cloud/nextcloud",
+            ),
+            (
+                "https://cloud.example.com/s/TOKEN?path=%2Fdocs",
+                "TOKEN",
+                "https://cloud.example.com",
+            ),
+            (
+                "https://cloud.example.com/s/TOKEN/download",
+                "TOKEN",
+                "https://cloud.example.com",
+            ),
+            (
+                "HTTPS://cloud.example.com/s/TOKEN",
+                "TOKEN",
+                "HTTPS://cloud.example.com",
+            ),
+        ],
+    )
+    def test_url_parsing(self, url: str, token: str, base: str) -> None:
+        """Test token and base URL extraction for one share URL."""
+        uploader = NextcloudUploader(url)
+
+        assert uploader.share_token == token
+        assert uploader.base_url == base
+
+    @pytest.mark.parametrize(
+        ("url", "webdav"),
+        [
+            (
+                "https://cloud.example.com/s/TOKEN",
+                "https://cloud.example.com/public.php/webdav/",
+            ),
+            (
+                "https://cloud.example.com/nextcloud/s/TOKEN",
+                "https://cloud.example.com/nextcloud/public.php/webdav/",
+            ),
+        ],
+    )
+    def test_webdav_url(self, url: str, webdav: str) -> None:
+        """Test WebDAV URL construction for one share URL."""
+        uploader = NextcloudUploader(url)
+
+        assert uploader.webdav_url == webdav
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://cloud.example.com/invalid/url",
+            "https://cloud.example.com/s/",
+        ],
+    )
+    def test_invalid_url(self, url: str) -> None:
+        """Test that unparseable share URLs raise ValueError."""
         with pytest.raises(ValueError, match="Could not extract share token"):
-            NextcloudUploader("https://cloud.example.com/invalid/url")
-
-    def test_extract_token_missing_token(self) -> None:
-        """Test that URL without token raises ValueError."""
-        with pytest.raises(ValueError, match="Could not extract share token"):
-            NextcloudUploader("https://cloud.example.com/s/")
-
-
-class TestGetBaseUrl:
-    """Test base URL extraction."""
-
-    def test_base_url_standard(self) -> None:
-        """Test base URL from standard setup."""
-        uploader = NextcloudUploader("https://cloud.example.com/s/TOKEN")
-        assert uploader.base_url == "https://cloud.example.com"
-
-    def test_base_url_with_nextcloud_path(self) -> None:
-        """Test base URL with /nextcloud path."""
-        uploader = NextcloudUploader(
-            "https://cloud.example.com/nextcloud/s/TOKEN"
-        )
-        assert uploader.base_url == "https://cloud.example.com/nextcloud"
-
-    def test_base_url_custom_port(self) -> None:
-        """Test base URL with custom port."""
-        uploader = NextcloudUploader("https://cloud.example.com:8443/s/TOKEN")
-        assert uploader.base_url == "https://cloud.example.com:8443"
-
-    def test_base_url_subdirectory(self) -> None:
-        """Test base URL with subdirectory."""
-        uploader = NextcloudUploader(
-            "https://example.com/cloud/nextcloud/s/TOKEN"
-        )
-        assert (
-            uploader.base_url == "https://example.com/cloud/nextcloud"
-        )
-
-
-class TestConstructWebdavUrl:
-    """Test WebDAV URL construction."""
-
-    def test_webdav_url_standard(self) -> None:
-        """Test WebDAV URL construction for standard setup."""
-        uploader = NextcloudUploader("https://cloud.example.com/s/TOKEN")
-        expected = "https://cloud.example.com/public.php/webdav/"
-        assert uploader.webdav_url == expected
-
-    def test_webdav_url_with_nextcloud_path(self) -> None:
-        """Test WebDAV URL with /nextcloud path."""
-        uploader = NextcloudUploader(
-            "https://cloud.example.com/nextcloud/s/TOKEN"
-        )
-        expected = "https://cloud.example.com/nextcloud/public.php/webdav/"
-        assert uploader.webdav_url == expected
+            NextcloudUploader(url)
 
 
 class TestUploadFile:
     """Test file upload functionality."""
 
     def test_upload_success(
-        self,
-        sample_share_url: str,
-        temp_file: Path,
-        mock_successful_response,
-        mocker,
+        self, sample_share_url: str, temp_file: Path, patched_put
     ) -> None:
         """Test successful file upload."""
         uploader = NextcloudUploader(sample_share_url)
 
-        # Mock the requests.put call
-        mock_put = mocker.patch("requests.put", return_value=mock_successful_response)
-
         result = uploader.upload_file(temp_file)
 
         assert result is True
-        mock_put.assert_called_once()
+        patched_put.assert_called_once()
 
-        # Verify the call arguments
-        call_args = mock_put.call_args
+        # Verify the call arguments and session credentials
+        call_args = patched_put.call_args
         assert temp_file.name in str(call_args[0][0])  # URL contains filename
-        assert call_args[1]["auth"] == ("TestToken123", "")
+        assert call_args[1]["timeout"] == uploader.timeout
+        expected = "Basic " + base64.b64encode(b"TestToken123:").decode()
+        assert uploader._session.headers["Authorization"] == expected
 
     def test_upload_with_password(
         self,
         sample_share_url: str,
         share_password: str,
-        temp_file: Path,
-        mock_successful_response,
-        mocker,
+        patched_put,
     ) -> None:
         """Test upload with password."""
         uploader = NextcloudUploader(sample_share_url, share_password)
 
-        mock_put = mocker.patch("requests.put", return_value=mock_successful_response)
-
-        result = uploader.upload_file(temp_file)
+        result = uploader.upload_file(io.BytesIO(b"hello"), "x.txt")
 
         assert result is True
-        call_args = mock_put.call_args
-        assert call_args[1]["auth"] == ("TestToken123", share_password)
+        assert patched_put.called
+        expected = "Basic " + base64.b64encode(
+            f"TestToken123:{share_password}".encode()
+        ).decode()
+        assert uploader._session.headers["Authorization"] == expected
 
     def test_upload_with_custom_name(
         self,
         sample_share_url: str,
-        temp_file: Path,
         mock_successful_response,
-        mocker,
     ) -> None:
         """Test upload with custom remote filename."""
         uploader = NextcloudUploader(sample_share_url)
+        session = DummySession(response=mock_successful_response)
+        uploader._session = session
 
-        mock_put = mocker.patch("requests.put", return_value=mock_successful_response)
-
-        result = uploader.upload_file(temp_file, remote_name="custom_name.txt")
+        result = uploader.upload_file(
+            io.BytesIO(b"hello"), remote_name="custom_name.txt"
+        )
 
         assert result is True
-        call_args = mock_put.call_args
-        assert "custom_name.txt" in str(call_args[0][0])
+        assert session.calls == [("PUT", uploader.webdav_url + "custom_name.txt")]
 
-    def test_upload_file_not_found(self, sample_share_url: str) -> None:
+    def test_upload_file_not_found(self, default_uploader) -> None:
         """Test upload with non-existent file."""
-        uploader = NextcloudUploader(sample_share_url)
-
         non_existent_file = Path("/tmp/nonexistent_file_12345.txt")
 
         with pytest.raises(FileNotFoundError):
-            uploader.upload_file(non_existent_file)
+            default_uploader.upload_file(non_existent_file)
 
     def test_upload_auth_error(
-        self,
-        sample_share_url: str,
-        temp_file: Path,
-        mock_auth_error_response,
-        mocker,
+        self, sample_share_url: str, mock_auth_error_response
     ) -> None:
         """Test upload with authentication error."""
         uploader = NextcloudUploader(sample_share_url)
+        uploader._session = DummySession(response=mock_auth_error_response)
 
-        mocker.patch("requests.put", return_value=mock_auth_error_response)
-
-        result = uploader.upload_file(temp_file)
+        result = uploader.upload_file(io.BytesIO(b"hello"), "x.txt")
 
         assert result is False
 
     def test_upload_permission_error(
-        self,
-        sample_share_url: str,
-        temp_file: Path,
-        mock_permission_error_response,
-        mocker,
+        self, sample_share_url: str, mock_permission_error_response
     ) -> None:
         """Test upload with permission error."""
         uploader = NextcloudUploader(sample_share_url)
+        uploader._session = DummySession(response=mock_permission_error_response)
 
-        mocker.patch("requests.put", return_value=mock_permission_error_response)
-
-        result = uploader.upload_file(temp_file)
+        result = uploader.upload_file(io.BytesIO(b"hello"), "x.txt")
 
         assert result is False
 
-    def test_upload_network_error(
-        self, sample_share_url: str, temp_file: Path, mocker
-    ) -> None:
+    def test_upload_network_error(self, sample_share_url: str) -> None:
         """Test upload with network error."""
         uploader = NextcloudUploader(sample_share_url)
-
-        mocker.patch(
-            "requests.put",
-            side_effect=requests.exceptions.ConnectionError("Network error"),
+        uploader._session = DummySession(
+            error=requests.exceptions.ConnectionError("Network error")
         )
 
         with pytest.raises(requests.exceptions.RequestException):
-            uploader.upload_file(temp_file)
+            uploader.upload_file(io.BytesIO(b"hello"), "x.txt")
 
     def test_upload_binary_file(
         self,
         sample_share_url: str,
         temp_binary_file: Path,
         mock_successful_response,
-        mocker,
     ) -> None:
         """Test uploading binary file."""
         uploader = NextcloudUploader(sample_share_url)
-
-        mock_put = mocker.patch("requests.put", return_value=mock_successful_response)
+        session = DummySession(response=mock_successful_response)
+        uploader._session = session
 
         result = uploader.upload_file(temp_binary_file)
 
         assert result is True
-        mock_put.assert_called_once()
+        assert len(session.calls) == 1
 
     def test_upload_with_progress_bar(
-        self,
-        sample_share_url: str,
-        temp_file: Path,
-        mock_successful_response,
-        mocker,
+        self, sample_share_url: str, patched_put
     ) -> None:
         """Test upload with progress bar enabled."""
         uploader = NextcloudUploader(sample_share_url)
 
-        mock_put = mocker.patch("requests.put", return_value=mock_successful_response)
-
         # Upload with progress bar enabled
-        result = uploader.upload_file(temp_file, show_progress=True)
+        result = uploader.upload_file(
+            io.BytesIO(b"hello"), "x.txt", show_progress=True
+        )
+
+        assert result is True
+        patched_put.assert_called_once()
+
+    def test_upload_from_stream(
+        self, sample_share_url: str, mock_successful_response
+    ) -> None:
+        """Test uploading an in-memory stream leaves it usable."""
+        uploader = NextcloudUploader(sample_share_url)
+        session = DummySession(response=mock_successful_response)
+        uploader._session = session
+        buffer = io.BytesIO(b"stream content")
+        buffer.seek(5)  # a prior consumer moved the position
+
+        result = uploader.upload_file(buffer, remote_name="stream.txt")
+
+        assert result is True
+        assert session.calls == [("PUT", uploader.webdav_url + "stream.txt")]
+        # The stream was rewound for the upload and is not closed
+        assert not buffer.closed
+        assert buffer.tell() == 0
+
+
+class TestTransportSelection:
+    """Test selection of the underlying HTTP transport."""
+
+    def test_default_transport_is_requests(self, sample_share_url: str) -> None:
+        """Test that the default transport is a requests session."""
+        uploader = NextcloudUploader(sample_share_url)
+
+        assert isinstance(uploader._session, requests.Session)
+
+    def test_requests_transport_socket_options(
+        self, sample_share_url: str
+    ) -> None:
+        """Test that upload sockets get the tuned socket options."""
+        import socket
+
+        from nextcloudcli.uploader import _UploadHTTPAdapter
+
+        uploader = NextcloudUploader(sample_share_url)
+
+        adapter = uploader._session.get_adapter("https://cloud.example.com")
+        assert isinstance(adapter, _UploadHTTPAdapter)
+        options = adapter.poolmanager.connection_pool_kw["socket_options"]
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in options
+
+    def test_unknown_transport_raises(self, sample_share_url: str) -> None:
+        """Test that an unknown transport name raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown transport"):
+            NextcloudUploader(sample_share_url, transport="carrier-pigeon")
+
+    def test_httpx_transport(self, sample_share_url: str) -> None:
+        """Test that the httpx transport builds an HTTP/2 client."""
+        pytest.importorskip("httpx", reason="requires the http2 extra")
+        from nextcloudcli.uploader import _HttpxSession
+
+        uploader = NextcloudUploader(sample_share_url, transport="httpx")
+
+        assert isinstance(uploader._session, _HttpxSession)
+        expected = "Basic " + base64.b64encode(b"TestToken123:").decode()
+        assert uploader._session.headers["Authorization"] == expected
+        uploader.close()
+
+    def test_httpx_transport_upload(
+        self, sample_share_url: str, temp_file: Path
+    ) -> None:
+        """Test uploading through the httpx transport."""
+        httpx = pytest.importorskip("httpx", reason="requires the http2 extra")
+
+        with NextcloudUploader(sample_share_url, transport="httpx") as uploader:
+            response = httpx.Response(
+                201, request=httpx.Request("PUT", sample_share_url)
+            )
+            with patch.object(
+                uploader._session._client, "put", return_value=response
+            ) as mock_put:
+                result = uploader.upload_file(temp_file)
 
         assert result is True
         mock_put.assert_called_once()
 
 
+class TestUploadFileChunked:
+    """Test chunked/parallel file upload functionality."""
+
+    def test_chunked_upload_success(
+        self,
+        sample_share_url: str,
+        large_temp_file: Path,
+        mock_successful_response,
+    ) -> None:
+        """Test successful chunked upload issues MKCOL, PUTs and MOVE."""
+        uploader = NextcloudUploader(sample_share_url)
+
+        with patch(
+            "requests.Session.put", return_value=mock_successful_response
+        ) as mock_put, patch(
+            "requests.Session.request", return_value=mock_successful_response
+        ) as mock_request:
+            result = uploader.upload_file_chunked(
+                large_temp_file, chunk_size=256 * 1024
+            )
+
+        assert result is True
+        # 1 MB file in 256 KB chunks -> 4 chunk PUTs
+        assert mock_put.call_count == 4
+        methods = [call[0][0] for call in mock_request.call_args_list]
+        assert methods == ["MKCOL", "MOVE"]
+
+    def test_chunked_upload_mkcol_failure(
+        self,
+        sample_share_url: str,
+        large_temp_file: Path,
+        mock_permission_error_response,
+    ) -> None:
+        """Test chunked upload aborts when the upload folder fails."""
+        uploader = NextcloudUploader(sample_share_url)
+
+        with patch("requests.Session.put") as mock_put, patch(
+            "requests.Session.request",
+            return_value=mock_permission_error_response,
+        ):
+            result = uploader.upload_file_chunked(large_temp_file)
+
+        assert result is False
+        mock_put.assert_not_called()
+
+    def test_chunked_upload_chunk_failure(
+        self,
+        sample_share_url: str,
+        large_temp_file: Path,
+        mock_successful_response,
+        mock_auth_error_response,
+    ) -> None:
+        """Test chunked upload fails when a chunk PUT fails."""
+        uploader = NextcloudUploader(sample_share_url)
+
+        with patch(
+            "requests.Session.put", return_value=mock_auth_error_response
+        ), patch(
+            "requests.Session.request", return_value=mock_successful_response
+        ):
+            result = uploader.upload_file_chunked(large_temp_file)
+
+        assert result is False
+
+    def test_chunked_upload_file_not_found(self, default_uploader) -> None:
+        """Test chunked upload with non-existent file."""
+        with pytest.raises(FileNotFoundError):
+            default_uploader.upload_file_chunked(
+                Path("/tmp/nonexistent_12345.bin")
+            )
+
+
 class TestConnectionTest:
     """Test connection testing functionality."""
 
     def test_connection_success(
-        self, sample_share_url: str, mock_propfind_response, mocker
+        self, sample_share_url: str, mock_propfind_response
     ) -> None:
         """Test successful connection test."""
         uploader = NextcloudUploader(sample_share_url)
 
-        mock_request = mocker.patch(
-            "requests.request", return_value=mock_propfind_response
-        )
-
-        result = uploader.test_connection()
+        with patch(
+            "requests.Session.request", return_value=mock_propfind_response
+        ) as mock_request:
+            result = uploader.test_connection()
 
         assert result is True
         mock_request.assert_called_once()
-        assert mock_request.call_args[0][0] == "PROPFIND"
+        assert mock_request.call_args[0][0] == "HEAD"
+        assert mock_request.call_args[1]["timeout"] == uploader.test_timeout
 
     def test_connection_with_password(
         self,
         sample_share_url: str,
         share_password: str,
         mock_propfind_response,
-        mocker,
     ) -> None:
         """Test connection with password."""
         uploader = NextcloudUploader(sample_share_url, share_password)
 
-        mock_request = mocker.patch(
-            "requests.request", return_value=mock_propfind_response
-        )
-
-        result = uploader.test_connection()
+        with patch(
+            "requests.Session.request", return_value=mock_propfind_response
+        ) as mock_request:
+            result = uploader.test_connection()
 
         assert result is True
-        call_args = mock_request.call_args
-        assert call_args[1]["auth"] == ("TestToken123", share_password)
-
-    def test_connection_auth_failure(
-        self, sample_share_url: str, mock_auth_error_response, mocker
+        assert mock_request.called
+        expected = "Basic " + base64.b64encode(
+            f"TestToken123:{share_password}".encode()
+        ).decode()
+        assert uploader._session.headers["Authorization"] == expected
+
+    def test_connection_auth_error_is_reachable(
+        self, sample_share_url: str, mock_auth_error_response
     ) -> None:
-        """Test connection test with auth failure."""
+        """Test that a 401 counts as reachable (the endpoint exists)."""
         uploader = NextcloudUploader(sample_share_url)
 
-        mocker.patch("requests.request", return_value=mock_auth_error_response)
+        with patch(
+            "requests.Session.request", return_value=mock_auth_error_response
+        ):
+            result = uploader.test_connection()
+
+        assert result is True
+
+    def test_connection_server_error(self, sample_share_url: str) -> None:
+        """Test connection test with a server error response."""
+        uploader = NextcloudUploader(sample_share_url)
 
-        result = uploader.test_connection()
+        mock_response = MagicMock()
+        mock_response.status_code = 500
+        mock_response.text = "Internal Server Error"
+        with patch("requests.Session.request", return_value=mock_response):
+            result = uploader.test_connection()
 
         assert result is False
 
-    def test_connection_network_error(
-        self, sample_share_url: str, mocker
-    ) -> None:
+    def test_connection_network_error(self, sample_share_url: str) -> None:
         """Test connection test with network error."""
         uploader = NextcloudUploader(sample_share_url)
 
-        mocker.patch(
-            "requests.request",
-            side_effect=requests.exceptions.ConnectionError("Network error"),
-        )
-
-        result = uploader.test_connection()
+        error = requests.exceptions.ConnectionError("Network error")
+        with patch("requests.Session.request", side_effect=error):
+            result = uploader.test_connection()
 
         assert result is False